@@ -3,11 +3,15 @@ from dataclasses import dataclass
 from typing import List, Union
 from pprint import pprint as pp
 from .Flow import Flow
+from .Widget import Widget
+from .Related import Related
 import logging
 
 
 @dataclass
-class App:
+class App(Related):
+    RELATIONS = {"flows": "get_flows", "widgets": "get_widgets"}
+
     interface: Interface
     data: dict
 
@@ -73,14 +77,26 @@ class App:
 
         return await self.get_app_by_id(self.interface, new_app_id)
 
-    async def get_flows(self):
+    async def get_flows(self, refresh: bool = False):
         """
-        Gets the flows associated with the App
+        Gets the flows associated with the App.  The flows are only loaded from Podio once.
 
+        :param refresh: Load the flows from Podio even if they are already loaded
         :return: A list of flow objects
         """
 
-        return Flow.get_flows("app", self.app_id)
+        return await self._memoize("flows", lambda: Flow.get_flows(self.interface, "app", self.app_id), refresh)
+
+    async def get_widgets(self, refresh: bool = False) -> List[Widget]:
+        """
+        Gets the widgets on the App.  The widgets are only loaded from Podio once.
+
+        :param refresh: Load the widgets from Podio even if they are already loaded
+        :return: A list of Widget objects
+        """
+
+        return await self._memoize("widgets", lambda: Widget.list_widgets(self.interface, "app", self.app_id),
+                                   refresh)
 
     async def export_items(self):
         """
@@ -93,14 +109,26 @@ class App:
 
         return await response.json()
 
-    async def filter_items(self):
+    async def filter_items(self, filters: dict = None, limit: int = 30, offset: int = 0, sort_by: str = None,
+                           sort_desc: bool = True):
         """
-        Gilters items and returns the matching
+        Filters items and returns the matching
 
+        :param filters: The filters to apply, keyed by field or filter key
+        :param limit: The number of items to return, at most 500
+        :param offset: The offset for the request when using Pagination
+        :param sort_by: The field or key to sort by
+        :param sort_desc: Sort By Descending or Ascending. Default Descending (True)
         :return: a list of items related to the filters
         """
 
-        response = await self.interface.call(f"/item/app/{self.data['app_id']}/filter/", method="POST")
+        payload = {"limit": limit, "offset": offset}
+        if filters is not None:
+            payload.update({"filters": filters})
+        if sort_by is not None:
+            payload.update({"sort_by": sort_by, "sort_desc": sort_desc})
+
+        response = await self.interface.call(f"/item/app/{self.data['app_id']}/filter/", method="POST", json=payload)
 
         return await response.json()
 
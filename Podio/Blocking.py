@@ -0,0 +1,119 @@
+"""
+A synchronous facade for code that can't use asyncio, e.g. Celery tasks and scripts.
+
+All work runs on one long-lived event loop in a background thread, which owns the Client and its Interface.  Blocking
+callers from any number of threads share its connection pool and OAuth token.
+
+    with BlockingClient(client_id, client_secret, refresh_token) as podio:
+        app = podio.get_app_by_id(1234)
+        items = app.filter_items(limit=100)
+"""
+import asyncio
+import inspect
+import threading
+from .Client import Client
+from .Interface import Interface
+
+
+class Blocking:
+    """
+    Wraps an object from this package so its coroutine methods block until they are done on the background loop.
+    Objects returned by those methods are wrapped as well.
+    """
+
+    def __init__(self, wrapped, loop: asyncio.AbstractEventLoop):
+        self.__dict__["_wrapped"] = wrapped
+        self.__dict__["_loop"] = loop
+
+    def _run(self, coro):
+        try:
+            running = asyncio.get_running_loop()
+        except RuntimeError:
+            running = None
+        if running is self._loop:
+            raise Exception("Blocking calls can not be made from the background loop")
+
+        return self._wrap(asyncio.run_coroutine_threadsafe(coro, self._loop).result())
+
+    def _wrap(self, result):
+        if isinstance(result, (list, tuple)):
+            return type(result)(self._wrap(value) for value in result)
+        elif isinstance(result, dict) and not isinstance(getattr(result, "interface", None), Interface):
+            return {key: self._wrap(value) for key, value in result.items()}
+        elif isinstance(getattr(result, "interface", None), Interface):
+            return Blocking(result, self._loop)
+
+        return result
+
+    def __getattr__(self, name):
+        attr = getattr(self._wrapped, name)
+        if not inspect.iscoroutinefunction(attr):
+            return attr
+
+        def blocking(*args, **kwargs):
+            return self._run(attr(*args, **kwargs))
+
+        blocking.__name__ = name
+        blocking.__doc__ = attr.__doc__
+
+        return blocking
+
+    def __setattr__(self, name, value):
+        setattr(self._wrapped, name, value)
+
+    def __getitem__(self, key):
+        return self._wrapped[key]
+
+    def __contains__(self, key):
+        return key in self._wrapped
+
+    def __iter__(self):
+        return iter(self._wrapped)
+
+    def __len__(self):
+        return len(self._wrapped)
+
+    def __repr__(self):
+        return f"Blocking({self._wrapped!r})"
+
+    def unwrap(self):
+        return self._wrapped
+
+
+class BlockingClient(Blocking):
+    def __init__(self, client_id: str, client_secret: str, refresh_token: str = None, username: str = None,
+                 password: str = None):
+        loop = asyncio.new_event_loop()
+        thread = threading.Thread(target=loop.run_forever, name="podio-loop", daemon=True)
+        thread.start()
+
+        super().__init__(Client(client_id, client_secret, refresh_token, username, password), loop)
+        self.__dict__["_thread"] = thread
+
+    @property
+    def interface(self) -> Interface:
+        return self._wrapped.interface
+
+    def submit(self, coro):
+        """
+        Runs any coroutine on the background loop, e.g. App.get_app_by_id(podio.interface, 1234)
+
+        :param coro: The coroutine to run
+        :return: the result, wrapped if it is an object from this package
+        """
+        return self._run(coro)
+
+    def close(self):
+        if not self._loop.is_running():
+            return
+
+        self._run(self._wrapped.close())
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
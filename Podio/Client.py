@@ -2,27 +2,116 @@ from .Interface import Interface
 from .Organization import Organization
 from .App import App
 from .Files import File
+from typing import Awaitable, Callable, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from .Receiver import Receiver
 
 
 class Client:
     def __init__(self, client_id: str, client_secret: str, refresh_token: str = None, username: str = None,
                  password: str = None):
         self.interface = Interface(client_secret, client_id, refresh_token, username, password)
+        self.apps: dict[int, App] = {}
+        self.receiver: "Receiver" = None
+        self.handlers: dict[str, list[Callable[[dict], Awaitable]]] = {}
 
     async def __aenter__(self):
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.stop_listening()
         await self.interface.__aexit__(exc_type, exc_val, exc_tb)
 
     async def close(self):
+        await self.stop_listening()
         await self.interface.close()
 
     async def get_org(self, url_label):
         return await Organization.get_org(url_label, self.interface)
 
-    async def get_app_by_id(self, app_id):
-        return await App.get_app_by_id(self.interface, app_id)
+    async def get_app_by_id(self, app_id, refresh: bool = False):
+        """
+        Gets an App.  While listening for hooks, loaded apps are reused and kept up to date by "app.update" events,
+        otherwise the App is always loaded from Podio.
+
+        :param app_id: The ID of the app in question
+        :param refresh: Load the App from Podio even if it is already loaded
+        :return: an App object
+        """
+        if self.receiver is None:
+            return await App.get_app_by_id(self.interface, app_id)
+
+        if refresh or app_id not in self.apps:
+            self.apps[app_id] = await App.get_app_by_id(self.interface, app_id)
+
+        return self.apps[app_id]
 
     async def copy_file(self, file_id):
         return await File.copy_file(self.interface, file_id)
+
+    def on(self, event_type: str, handler: Callable[[dict], Awaitable]):
+        """
+        Registers a coroutine to be called for hook events, so local mirrors can be kept in sync without polling.
+
+        For "item.create" and "item.update" events the current item is loaded and passed along under "item".
+
+        :param event_type: The event to handle. Can be one of "item.create", "item.update", "item.delete",
+                           "app.update"
+        :param handler: a coroutine function that is given the event as a dictionary
+        """
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    async def listen(self, host: str = "0.0.0.0", port: int = 8080, path: str = "/podio/hook") -> "Receiver":
+        """
+        Starts a webhook receiver for Podio hooks.  Hooks still need to be created with Hook.create_hook, pointing
+        at the public url of this receiver.
+
+        :param host: The host to listen on
+        :param port: The port to listen on
+        :param path: The path Podio will post events to
+        :return: the running Receiver
+        """
+        # aiohttp.web is only needed when listening, so it is not imported with the client
+        from .Receiver import Receiver
+
+        self.receiver = Receiver(self.interface, path)
+        for event_type in ("item.create", "item.update", "item.delete"):
+            self.receiver.on(event_type, self._item_event)
+        self.receiver.on("app.update", self._app_update)
+
+        await self.receiver.start(host, port)
+
+        return self.receiver
+
+    async def stop_listening(self):
+        if self.receiver is not None:
+            await self.receiver.stop()
+            self.receiver = None
+
+        # Without hooks the loaded apps would go stale
+        self.apps.clear()
+
+    async def _dispatch(self, event: dict):
+        for handler in self.handlers.get(event["type"], []):
+            await handler(event)
+
+    async def _item_event(self, event: dict):
+        # Loading the item costs a request, so only do it when someone is listening
+        if not self.handlers.get(event["type"]):
+            return
+
+        if event["type"] != "item.delete":
+            response = await self.interface.call(f"/item/{event['item_id']}")
+            event["item"] = await response.json()
+
+        await self._dispatch(event)
+
+    async def _app_update(self, event: dict):
+        if event["app_id"] in self.apps:
+            app = await App.get_app_by_id(self.interface, event["app_id"])
+            self.apps[event["app_id"]].data = app.data
+            self.apps[event["app_id"]].__dict__.update(app.data)
+            self.apps[event["app_id"]].invalidate()
+
+        await self._dispatch(event)
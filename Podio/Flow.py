@@ -8,7 +8,7 @@ class Flow:
     data: dict
 
     def __post_init__(self):
-        self.__dict__.update(data)
+        self.__dict__.update(self.data)
 
     @classmethod
     async def get_flows(cls, interface: Interface, ref_type: str, ref_id: int):
@@ -20,7 +20,7 @@ class Flow:
         :return: a list of flows associated with the reference
         """
 
-        endpoint = f"/{ref_type}/{ref_id}"
+        endpoint = f"/flow/{ref_type}/{ref_id}/"
 
         response = await interface.call(endpoint)
         response = await response.json()
@@ -0,0 +1,70 @@
+from .Interface import Interface
+from collections import UserDict
+
+
+class Hook(UserDict):
+
+    # Events that can be hooked for each reference type
+    HOOK_TYPES = {
+        "app": ["item.create", "item.update", "item.delete", "app.update", "app.delete"],
+        "space": ["app.create", "app.update", "app.delete"],
+    }
+
+    def __init__(self, interface: Interface, data: dict):
+        super().__init__(data)
+        self.interface = interface
+
+    @classmethod
+    async def create_hook(cls, interface: Interface, ref_type: str, ref_id: int, url: str, hook_type: str) -> "Hook":
+        """
+        Creates a new hook on the reference.  The hook must be verified before Podio will send events to it.
+
+        :param interface: The interface to interact with Podio
+        :param ref_type: The reference type to hook. Can be one of "app", "space"
+        :param ref_id: The id of the reference
+        :param url: The url Podio should send the events to
+        :param hook_type: The event to hook, e.g. "item.create"
+        :return: a Hook object representing the new hook
+        """
+        if ref_type not in cls.HOOK_TYPES:
+            raise Exception(f"\"ref_type\" should be one of: {', '.join(cls.HOOK_TYPES)}")
+        elif hook_type not in cls.HOOK_TYPES[ref_type]:
+            raise Exception(f"\"hook_type\" should be one of: {', '.join(cls.HOOK_TYPES[ref_type])}")
+
+        response = await interface.call(f"/hook/{ref_type}/{ref_id}/",
+                                        method="POST",
+                                        json={"url": url, "type": hook_type})
+        data = await response.json()
+
+        return cls(interface, {**data, "url": url, "type": hook_type})
+
+    @classmethod
+    async def list_hooks(cls, interface: Interface, ref_type: str, ref_id: int) -> list["Hook"]:
+        """
+        Lists the hooks on a reference
+
+        :param interface: The interface to interact with Podio
+        :param ref_type: The reference type. Can be one of "app", "space"
+        :param ref_id: The id of the reference
+        :return: a list of Hook objects
+        """
+        response = await interface.call(f"/hook/{ref_type}/{ref_id}/")
+
+        return [cls(interface, data) for data in await response.json()]
+
+    @classmethod
+    async def validate(cls, interface: Interface, hook_id: int, code: str):
+        """
+        Completes the verification of a hook with the code Podio sent to it
+
+        :param interface: The interface to interact with Podio
+        :param hook_id: The id of the hook being verified
+        :param code: The code sent in the hook.verify event
+        """
+        await interface.call(f"/hook/{hook_id}/verify/validate", method="POST", json={"code": code})
+
+    async def request_verification(self):
+        await self.interface.call(f"/hook/{self['hook_id']}/verify/request", method="POST")
+
+    async def delete(self):
+        await self.interface.call(f"/hook/{self['hook_id']}", method="DELETE")
@@ -1,5 +1,7 @@
-from aiohttp import ClientSession, ClientResponse, ClientResponseError
+from aiohttp import ClientSession, ClientResponse, ClientResponseError, TCPConnector
+import asyncio
 import logging
+import time
 from pprint import pprint as pp
 import json
 
@@ -10,18 +12,37 @@ class Interface:
     def __init__(self, client_secret: str, client_id: str, refresh_token: str = None, username: str = None,
                  password: str = None):
         self.base_url = "https://api.podio.com"
-        self.session: ClientSession = ClientSession()
+        # The connector and session are created on the first request, inside the running loop
+        self.connector: TCPConnector = None
+        self.session: ClientSession = None
         self.client_secret = client_secret
         self.client_id = client_id
         self.refresh_token = refresh_token
         self.username = username
         self.password = password
+        self.expires_at: float = None
+        self._auth_lock = asyncio.Lock()
+
+    # Tokens are renewed this many seconds before they expire
+    EXPIRY_MARGIN = 60
+
+    def _new_session(self, **kwargs) -> ClientSession:
+        if self.connector is None:
+            self.connector = TCPConnector()
+
+        return ClientSession(connector=self.connector, connector_owner=False, **kwargs)
 
     async def close(self):
-        await self.session.close()
+        if self.session is not None:
+            await self.session.close()
+        if self.connector is not None:
+            await self.connector.close()
+
+        self.session = None
+        self.connector = None
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
-        await self.session.__aexit__(exc_type, exc_val, exc_tb)
+        await self.close()
 
     async def authenticate(self):
         endpoint = "/oauth/token"
@@ -53,9 +74,32 @@ class Interface:
 
             response = await self.call(endpoint, "POST", auth_call=True, params=params)
             response = await response.json()
+            self.refresh_token = response.get('refresh_token', self.refresh_token)
+
+        if "expires_in" in response:
+            self.expires_at = time.monotonic() + response["expires_in"] - self.EXPIRY_MARGIN
+        else:
+            self.expires_at = None
 
-        self.session = ClientSession(
+        # Replace the unauthenticated session.  Both share the connector, so pooled connections are kept
+        old_session = self.session
+        self.session = self._new_session(
             headers={"Authorization": f"OAuth2 {response['access_token']}"})
+        await old_session.close()
+
+    def _token_expired(self) -> bool:
+        if not self.session.headers.get("Authorization"):
+            return True
+
+        return self.expires_at is not None and time.monotonic() >= self.expires_at
+
+    async def _reauthenticate(self, session: ClientSession):
+        """
+        Authenticates, unless another call already replaced the given session while waiting for the lock
+        """
+        async with self._auth_lock:
+            if self.session is session:
+                await self.authenticate()
 
     async def call(self, endpoint: str, method: str = "GET", auth_call: bool = False, **kwargs) -> ClientResponse:
         """ Makes calls to podio
@@ -65,30 +109,46 @@ class Interface:
         :param kwargs: Other arguments for ClientSession calls
         :return: a Client Response Object
         """
-        if not self.session.headers.get("Authorization") and not auth_call:
-            await self.authenticate()
+        # A closed session would fail every later call, so start a new one
+        if self.session is None or self.session.closed:
+            self.session = self._new_session()
+
+        # Concurrent calls share a single authentication
+        if not auth_call and self._token_expired():
+            await self._reauthenticate(self.session)
 
         url = f"{self.base_url}{endpoint}"
-        response = await self.session.request(method, url, **kwargs)
+        session = self.session
+        response = await session.request(method, url, **kwargs)
 
-        try:
-            await self.error_check(response)
-        except Exception as e:
-            error = response.content._buffer.pop()
-            try:
-                error = json.loads(error)
-            except json.JSONDecodeError:
-                raise e
-            raise Exception(error["error_description"])
+        # The token may have been revoked or expired early, so authenticate again and retry once
+        if response.status == 401 and not auth_call:
+            response.release()
+            await self._reauthenticate(session)
+            response = await self.session.request(method, url, **kwargs)
+
+        await self.error_check(response)
 
         return response
 
     async def error_check(self, response: ClientResponse):
+        """
+        Raises the error Podio gave for a failed request.  The session is left open, so only this request fails.
+        """
+        if response.ok:
+            return
+
+        # raise_for_status releases the response, so the error has to be read first
+        try:
+            data = await response.json(content_type=None)
+        except json.JSONDecodeError:
+            data = None
+
         try:
             response.raise_for_status()
         except ClientResponseError as e:
-            data = await response.json()
+            if not isinstance(data, dict) or "error_description" not in data:
+                raise e
             log.error(data["error_description"])
 
-            await self.session.close()
-            raise e
+            raise Exception(data["error_description"]) from e
@@ -1,3 +1,4 @@
+import asyncio
 from .Interface import Interface
 from collections import UserDict
 from typing import Union
@@ -8,12 +9,14 @@ class Member(UserDict):
         self.interface = interface
 
     @classmethod
-    async def get_members_from_space(cls, interface, space: Union[int, "Space"]) -> list["Member"]:
+    async def get_members_from_space(cls, interface, space: Union[int, "Space"],
+                                     limit: int = 500) -> list["Member"]:
         """
-        Retrieves a list of members from the given space
+        Retrieves a list of members from the given space, following pages until all members are loaded
 
         :param interface: The interface used to interact with podio
         :param space: The Space in question.  Can either be a space_id or Space Object
+        :param limit: The number of members to request per page
         :return: a list of Member objects representing users and their relationship with the space
         """
 
@@ -22,7 +25,35 @@ class Member(UserDict):
         else:
             space_id = space
 
-        response = await interface.call(f"/space/{space_id}/member/")
-        data = await response.json()
+        members = []
+        seen = set()
+        offset = 0
+        while True:
+            response = await interface.call(f"/space/{space_id}/member/", params={"limit": limit, "offset": offset})
+            data = await response.json()
 
-        return [cls(interface, member) for member in data]
\ No newline at end of file
+            page = [member for member in data if member["user"]["user_id"] not in seen]
+            seen.update(member["user"]["user_id"] for member in page)
+            members.extend(page)
+
+            if len(data) < limit or not page:
+                break
+            offset += limit
+
+        return [cls(interface, member) for member in members]
+
+    @classmethod
+    async def get_members_from_spaces(cls, interface,
+                                      spaces: list[Union[int, "Space"]]) -> dict[int, list["Member"]]:
+        """
+        Retrieves the members of several spaces concurrently
+
+        :param interface: The interface used to interact with podio
+        :param spaces: The Spaces in question.  Can either be space_ids or Space Objects
+        :return: a dictionary of space_id to the list of Member objects for that space
+        """
+
+        space_ids = [space if isinstance(space, int) else space["space_id"] for space in spaces]
+        results = await asyncio.gather(*[cls.get_members_from_space(interface, space_id) for space_id in space_ids])
+
+        return dict(zip(space_ids, results))
\ No newline at end of file
@@ -0,0 +1,182 @@
+import asyncio
+import json
+import logging
+import os
+from .Interface import Interface
+from .App import App
+from .Files import File
+
+log = logging.getLogger()
+
+# Fields Podio computes itself, which can not be written to
+READ_ONLY_TYPES = ("calculation",)
+
+
+class Migration:
+    """
+    Copies every item of one app into another, page by page.
+
+    The field mapping is worked out once up front.  Progress is written to a local checkpoint file after every item,
+    so a migration that is stopped part way through picks up where it left off when run again.
+    """
+
+    def __init__(self, source: App, target: App, checkpoint_path: str, match_by: str = "external_id",
+                 transfer_files: bool = False, page_size: int = 500, concurrency: int = 10):
+        """
+        :param source: The App to read items from
+        :param target: The App to write items to
+        :param checkpoint_path: Where to store the progress of the migration
+        :param match_by: How to match source fields to target fields. Can be one of "external_id", "label"
+        :param transfer_files: If True, files on the items are copied instead of being shared with the source item
+        :param page_size: The number of source items to read per request, at most 500
+        :param concurrency: The number of items to write at the same time
+        """
+        match_by_values = ("external_id", "label")
+        if match_by not in match_by_values:
+            raise Exception(f"\"match_by\" should be one of: {', '.join(match_by_values)}")
+
+        self.source = source
+        self.target = target
+        self.interface: Interface = target.interface
+        self.checkpoint_path = checkpoint_path
+        self.match_by = match_by
+        self.transfer_files = transfer_files
+        self.page_size = page_size
+        self.semaphore = asyncio.Semaphore(concurrency)
+
+        self.field_map = self._map_fields()
+        self.checkpoint = self._load_checkpoint()
+
+    def _map_fields(self) -> dict:
+        """
+        Matches the source fields to the target fields
+
+        :return: a dictionary of source field_id to target field
+        """
+        target_fields = {field[self.match_by]: field for field in self.target.data["fields"]}
+
+        field_map = {}
+        for field in self.source.data["fields"]:
+            target_field = target_fields.get(field[self.match_by])
+            if target_field is None:
+                log.warning(f"No Matching field for {field[self.match_by]}, it will not be migrated")
+                continue
+            if target_field["type"] in READ_ONLY_TYPES:
+                continue
+            field_map[field["field_id"]] = target_field
+
+        return field_map
+
+    def _load_checkpoint(self) -> dict:
+        if os.path.exists(self.checkpoint_path):
+            with open(self.checkpoint_path) as file:
+                return json.load(file)
+
+        return {"offset": 0, "done": {}}
+
+    def _save_checkpoint(self):
+        temp_path = f"{self.checkpoint_path}.tmp"
+        with open(temp_path, "w") as file:
+            json.dump(self.checkpoint, file)
+        os.replace(temp_path, self.checkpoint_path)
+
+    async def _copy_file(self, file_id: int) -> int:
+        if not self.transfer_files:
+            return file_id
+
+        return (await File.copy_file(self.interface, file_id))["file_id"]
+
+    async def _convert_values(self, target_field: dict, values: list) -> list:
+        """
+        Turns the values of a read item into the form used when creating an item
+
+        :param target_field: The field on the target app
+        :param values: The values of the field on the source item
+        :return: the values to write to the target field
+        """
+        field_type = target_field["type"]
+        converted = []
+        for value in values:
+            if field_type == "category":
+                options = {option["text"]: option["id"]
+                           for option in target_field["config"]["settings"]["options"]}
+                if value["value"]["text"] not in options:
+                    log.warning(f"No Matching option {value['value']['text']} for {target_field['label']}")
+                    continue
+                converted.append(options[value["value"]["text"]])
+            elif field_type == "date":
+                converted.append({key: value[key] for key in ("start", "end") if value.get(key)})
+            elif field_type == "app":
+                converted.append(value["value"]["item_id"])
+            elif field_type == "contact":
+                converted.append(value["value"]["profile_id"])
+            elif field_type == "image":
+                converted.append(await self._copy_file(value["value"]["file_id"]))
+            elif field_type == "embed":
+                embed = {"embed": value["embed"]["embed_id"]}
+                if value.get("file"):
+                    embed.update({"file": await self._copy_file(value["file"]["file_id"])})
+                converted.append(embed)
+            elif field_type == "money":
+                converted.append({"value": value["value"], "currency": value["currency"]})
+            elif field_type in ("email", "phone"):
+                converted.append({"type": value["type"], "value": value["value"]})
+            else:
+                converted.append(value["value"])
+
+        return converted
+
+    async def _migrate_item(self, item: dict) -> int:
+        """
+        Writes a single source item to the target app
+
+        :param item: The source item as returned by App.filter_items
+        :return: the item_id of the new item
+        """
+        async with self.semaphore:
+            fields = {}
+            for field in item["fields"]:
+                target_field = self.field_map.get(field["field_id"])
+                if target_field is None:
+                    continue
+                values = await self._convert_values(target_field, field["values"])
+                if values:
+                    fields[target_field["external_id"]] = values
+
+            payload = {"fields": fields}
+            if item.get("files"):
+                payload.update({"file_ids": [await self._copy_file(file["file_id"]) for file in item["files"]]})
+
+            response = await self.interface.call(f"/item/app/{self.target.data['app_id']}/",
+                                                 method="POST",
+                                                 json=payload)
+            response = await response.json()
+
+        self.checkpoint["done"][str(item["item_id"])] = response["item_id"]
+        self._save_checkpoint()
+
+        return response["item_id"]
+
+    async def run(self) -> int:
+        """
+        Migrates the items, resuming from the checkpoint if there is one
+
+        :return: The number of items migrated so far, including those from earlier runs
+        """
+        while True:
+            items = await self.source.filter_items(limit=self.page_size, offset=self.checkpoint["offset"],
+                                                   sort_by="created_on", sort_desc=False)
+            items = items["items"]
+
+            pending = [item for item in items if str(item["item_id"]) not in self.checkpoint["done"]]
+            await asyncio.gather(*[self._migrate_item(item) for item in pending])
+
+            # Only the current page needs to be tracked item by item
+            self.checkpoint["offset"] += len(items)
+            self.checkpoint["done"] = {}
+            self._save_checkpoint()
+
+            log.info(f"Migrated {self.checkpoint['offset']} items")
+
+            if len(items) < self.page_size:
+                return self.checkpoint["offset"]
@@ -2,10 +2,13 @@ from .Interface import Interface
 from dataclasses import dataclass
 from typing import List
 from .Space import Space
+from .Related import Related
 
 
 @dataclass
-class Organization:
+class Organization(Related):
+    RELATIONS = {"spaces": "get_spaces"}
+
     url_label: str
     interface: Interface
     data: dict
@@ -30,14 +33,15 @@ class Organization:
 
         return Organization(url_label, interface, response)
 
-    async def get_spaces(self) -> List[Space]:
+    async def get_spaces(self, refresh: bool = False) -> List[Space]:
         """
-        Gets the Spaces for the Organization
+        Gets the Spaces for the Organization.  The spaces are only loaded from Podio once.
 
+        :param refresh: Load the spaces from Podio even if they are already loaded
         :return: a list of spaces for the org
         """
 
-        return await Space.get_space_by_org(self.interface, self.org_id)
+        return await self._memoize("spaces", lambda: Space.get_space_by_org(self.interface, self.org_id), refresh)
 
     async def new_space(self, name: str, privacy: str = "closed", auto_join: bool = False, new_app_post: bool = False,
                         new_member_post: bool = False) -> Space:
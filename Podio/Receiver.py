@@ -0,0 +1,83 @@
+"""
+A small webhook server for Podio hooks.
+
+Podio posts events as form data with a "type" field.  "hook.verify" events are answered automatically, every other
+event is passed to the handlers registered for its type.
+
+Refer to Hooks Here: https://developers.podio.com/doc/hooks
+"""
+import asyncio
+import logging
+from aiohttp import web
+from .Interface import Interface
+from .Hook import Hook
+from typing import Awaitable, Callable
+
+log = logging.getLogger()
+
+
+class Receiver:
+    def __init__(self, interface: Interface, path: str = "/podio/hook"):
+        self.interface = interface
+        self.path = path
+        self.handlers: dict[str, list[Callable[[dict], Awaitable]]] = {}
+
+        self.app = web.Application()
+        self.app.router.add_post(self.path, self.handle)
+        self.runner: web.AppRunner = None
+        self._tasks: set[asyncio.Task] = set()
+
+    def on(self, event_type: str, handler: Callable[[dict], Awaitable]):
+        """
+        Registers a coroutine to be called for an event type
+
+        :param event_type: The event to handle, e.g. "item.update"
+        :param handler: a coroutine function that is given the event as a dictionary
+        """
+        self.handlers.setdefault(event_type, []).append(handler)
+
+    async def handle(self, request: web.Request) -> web.Response:
+        event = dict(await request.post())
+        event_type = event.get("type")
+
+        if event_type == "hook.verify":
+            await Hook.validate(self.interface, event["hook_id"], event["code"])
+            return web.Response()
+
+        for field in ("hook_id", "item_id", "item_revision_id", "app_id"):
+            if field in event:
+                event[field] = int(event[field])
+
+        handlers = self.handlers.get(event_type, [])
+        if not handlers:
+            log.debug(f"No handlers for {event_type}")
+
+        # Answer Podio straight away, the handlers may need to call back into the API
+        for handler in handlers:
+            task = asyncio.create_task(self._run_handler(handler, event))
+            self._tasks.add(task)
+            task.add_done_callback(self._tasks.discard)
+
+        return web.Response()
+
+    @staticmethod
+    async def _run_handler(handler: Callable[[dict], Awaitable], event: dict):
+        try:
+            await handler(event)
+        except Exception:
+            log.exception(f"Handler failed for {event['type']}")
+
+    async def start(self, host: str = "0.0.0.0", port: int = 8080):
+        self.runner = web.AppRunner(self.app)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, host, port).start()
+
+    async def stop(self):
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+
+        # Handlers still running would call into an Interface that is about to be closed
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
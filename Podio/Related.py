@@ -0,0 +1,75 @@
+import asyncio
+from typing import Awaitable, Callable
+
+
+class Related:
+    """
+    Memoizes the related objects of Organizations, Spaces and Apps.
+
+    RELATIONS maps the name of a relation to the method that loads it.  Those methods load from Podio once, and then
+    return the same objects until invalidate is called or refresh is given.
+    """
+
+    RELATIONS: dict[str, str] = {}
+
+    @property
+    def _related(self) -> dict[str, asyncio.Future]:
+        if "_related_cache" not in self.__dict__:
+            self.__dict__["_related_cache"] = {}
+
+        return self.__dict__["_related_cache"]
+
+    async def _memoize(self, name: str, loader: Callable[[], Awaitable], refresh: bool = False):
+        """
+        Loads a relation once, sharing the result with callers that ask for it while it is still loading
+
+        :param name: The name of the relation
+        :param loader: a coroutine function that loads the relation from Podio
+        :param refresh: Load the relation from Podio even if it is already loaded
+        :return: the related objects
+        """
+        if refresh or name not in self._related:
+            self._related[name] = asyncio.ensure_future(loader())
+
+        future = self._related[name]
+        try:
+            return await asyncio.shield(future)
+        except Exception:
+            if self._related.get(name) is future:
+                self._related.pop(name)
+            raise
+
+    def invalidate(self, *names: str):
+        """
+        Forgets loaded relations so they are loaded from Podio the next time they are used
+
+        :param names: The relations to forget.  If none are given, all of them are forgotten
+        """
+        for name in names or list(self._related):
+            self._related.pop(name, None)
+
+    async def prefetch(self, *paths: str):
+        """
+        Loads a subgraph of related objects concurrently
+
+        :param paths: Dotted relation paths, e.g. "spaces.apps", "spaces.widgets"
+        """
+        tree = {}
+        for path in paths:
+            node = tree
+            for name in path.split("."):
+                node = node.setdefault(name, {})
+
+        await self._prefetch_tree(tree)
+
+    async def _prefetch_tree(self, tree: dict):
+        for name in tree:
+            if name not in self.RELATIONS:
+                raise Exception(f"Not a valid relation.  Valid relations are \"{', '.join(self.RELATIONS)}\"")
+
+        async def load(name: str, children: dict):
+            related = await getattr(self, self.RELATIONS[name])()
+            if children:
+                await asyncio.gather(*[obj._prefetch_tree(children) for obj in related])
+
+        await asyncio.gather(*[load(name, children) for name, children in tree.items()])
@@ -3,10 +3,15 @@ from .Interface import Interface
 from .App import App
 from .Widget import Widget
 from .Files import File
+from .Member import Member
+from .Related import Related
+import asyncio
 from typing import List, Union, NoReturn
 from collections import UserDict
 
-class Space(UserDict):
+class Space(UserDict, Related):
+
+    RELATIONS = {"apps": "get_apps", "widgets": "get_widgets", "files": "list_files", "members": "get_members"}
 
     def __init__(self, interface: Interface, data: dict):
         super().__init__(data)
@@ -52,14 +57,15 @@ class Space(UserDict):
 
         return space_list
 
-    async def get_apps(self) -> List[App]:
+    async def get_apps(self, refresh: bool = False) -> List[App]:
         """
-        Gets a list of the Apps in the space
+        Gets a list of the Apps in the space.  The apps are only loaded from Podio once.
 
+        :param refresh: Load the apps from Podio even if they are already loaded
         :return: a List of App objects
         """
 
-        return await App.get_app_by_space(self.interface, self["space_id"])
+        return await self._memoize("apps", lambda: App.get_app_by_space(self.interface, self["space_id"]), refresh)
 
     @classmethod
     async def new_space(cls, interface: Interface, org_id: int, name: str, privacy: str = "closed",
@@ -93,17 +99,40 @@ class Space(UserDict):
 
         return await cls.get_space_by_id(interface, space_id)
 
-    async def get_widgets(self):
-        return await Widget.list_widgets(**self._widget_params)
+    async def get_widgets(self, refresh: bool = False) -> list[Widget]:
+        return await self._memoize("widgets", lambda: Widget.list_widgets(**self._widget_params), refresh)
 
     async def add_widget(self, widget_type: str, title: str, config: dict, cols: int = None, rows: int = None,
                          x: int = None, y: int = None):
-        return await Widget.add_widget(widget_type=widget_type, title=title, config=config,
-                                       cols=cols, rows=rows, x=x, y=y,
-                                       **self._widget_params)
+        try:
+            return await Widget.add_widget(widget_type=widget_type, title=title, config=config,
+                                           cols=cols, rows=rows, x=x, y=y,
+                                           **self._widget_params)
+        finally:
+            self.invalidate("widgets")
+
+    async def reconcile_widgets(self, layout: list[dict], dry_run: bool = False) -> dict:
+        """
+        Makes the space's widgets match the desired layout, creating, updating and deleting only what differs
+
+        :param layout: A list of widget definitions, each with "type", "title", "config" and optionally
+                       "x", "y", "rows" and "cols"
+        :param dry_run: If True, only return the plan and make no changes
+        :return: a dictionary with "create", "update" and "delete" lists
+        """
+        try:
+            return await Widget.reconcile(layout=layout, dry_run=dry_run, **self._widget_params)
+        finally:
+            # Some of the changes may have been made even if one of them failed
+            if not dry_run:
+                self.invalidate("widgets")
+
+    async def list_files(self, refresh: bool = False) -> list[File]:
+        return await self._memoize("files", lambda: File.list_space_files(self.interface, self["space_id"]), refresh)
 
-    async def list_files(self) -> list[File]:
-        return await File.list_space_files(self.interface, self["space_id"])
+    async def get_members(self, refresh: bool = False) -> list[Member]:
+        return await self._memoize("members", lambda: Member.get_members_from_space(self.interface, self["space_id"]),
+                                   refresh)
 
     async def add_member(self, role: str, message: str, users: Union[list[int], int, "User", list["User"]] = None,
                          profiles: Union[int, list[int]] = None, mails: Union[list[str], str] = None,
@@ -168,3 +197,89 @@ class Space(UserDict):
         await self.interface.call(f"/space/{self['space_id']}/member",
                                   method="POST",
                                   json=payload)
+        self.invalidate("members")
+
+    @classmethod
+    async def bulk_add_members(cls, interface: Interface, spaces: list[Union[int, "Space"]], role: str, message: str,
+                               users: list[int] = None, profiles: list[int] = None, mails: list[str] = None,
+                               chunk_size: int = 50) -> dict[int, dict]:
+        """
+        Adds many members to many spaces.
+
+        The current members of every space are loaded first, and anyone already in a space is skipped.  The remaining
+        users, profiles and mails are sent in chunks of chunk_size, with all spaces processed concurrently.
+
+        :param interface: The interface to interact with Podio
+        :param spaces: The Spaces to add the members to. Can be a list of space ids or Space objects
+        :param role: The Role to give to the Added users.  Can be one of "light", "regular", "admin"
+        :param message: The custom message used to invite the users
+        :param users: The user ids to invite
+        :param profiles: The profile ids to invite
+        :param mails: the Email Addresses of people to invite
+        :param chunk_size: The number of invitees to send per request
+        :return: a report of space_id to invitee kind to invitee to one of "added", "existing" or the error message
+
+        report example:
+        {
+            SPACE_ID: {
+                "users": {USER_ID: "added"},
+                "profiles": {PROFILE_ID: "existing"},
+                "mails": {MAIL: "Invalid email"}
+            },
+            ...
+        }
+        """
+
+        roles = ["light", "regular", "admin"]
+        if role not in roles:
+            raise Exception(f"\"role\" should one one of the following: {', '.join(roles)}")
+
+        users = users or []
+        profiles = profiles or []
+        mails = mails or []
+
+        space_ids = [space if isinstance(space, int) else space["space_id"] for space in spaces]
+        existing = await Member.get_members_from_spaces(interface, space_ids)
+
+        async def add_to_space(space_id: int) -> dict:
+            members = existing[space_id]
+            member_users = {member["user"]["user_id"] for member in members}
+            member_profiles = {member["profile"]["profile_id"] for member in members if "profile" in member}
+            member_mails = {member["user"].get("mail", "").lower() for member in members}
+
+            report = {"users": {}, "profiles": {}, "mails": {}}
+            invites = []
+            for key, values, current in (("users", users, member_users),
+                                         ("profiles", profiles, member_profiles),
+                                         ("mails", mails, member_mails)):
+                for value in values:
+                    if (value.lower() if key == "mails" else value) in current:
+                        report[key][value] = "existing"
+                    else:
+                        invites.append((key, value))
+
+            for start in range(0, len(invites), chunk_size):
+                chunk = invites[start:start + chunk_size]
+                payload = {"role": role, "message": message}
+                for key, value in chunk:
+                    payload.setdefault(key, []).append(value)
+
+                try:
+                    await interface.call(f"/space/{space_id}/member", method="POST", json=payload)
+                except Exception as e:
+                    for key, value in chunk:
+                        report[key][value] = str(e)
+                else:
+                    for key, value in chunk:
+                        report[key][value] = "added"
+
+            return report
+
+        try:
+            reports = await asyncio.gather(*[add_to_space(space_id) for space_id in space_ids])
+        finally:
+            for space in spaces:
+                if isinstance(space, Space):
+                    space.invalidate("members")
+
+        return dict(zip(space_ids, reports))
@@ -0,0 +1,207 @@
+"""
+Columnar tables of items for analytics.
+
+Items are turned into one typed column per field external_id, using the field definitions in App.data["fields"] to
+pick the type of each column.  When NumPy is installed the columns are NumPy arrays, otherwise they are Python arrays.
+
+Column types:
+ - "number", "money", "progress", "duration": floats, NaN when empty
+ - "date": seconds since the epoch (UTC) as floats, NaN when empty
+ - "calculation": typed by the calculation's return type, as a number, a date or a raw value
+ - "category": the option id as integers, -1 when empty.  Option texts are in Table.categories
+ - "app", "contact": the referenced item_id or profile_id as integers, -1 when empty
+ - everything else: a list of the raw values, None when empty
+
+Only the first value of a field is used.
+"""
+import asyncio
+from array import array
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime, timezone
+from .App import App
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+FLOAT_TYPES = ("number", "money", "progress", "duration", "date")
+INT_TYPES = ("category", "app", "contact")
+
+
+def column_type(field: dict) -> str:
+    """
+    The type used to convert a field's values.  Calculations take the type of what they return.
+
+    :param field: The field definition, as found in App.data["fields"]
+    :return: the field type to convert the values as
+    """
+    if field["type"] != "calculation":
+        return field["type"]
+
+    return_type = field["config"]["settings"].get("return_type")
+    if return_type in ("number", "date"):
+        return return_type
+
+    return "text"
+
+
+def convert_items(spec: dict[int, tuple[str, str]], items: list[dict]) -> dict[str, list]:
+    """
+    Turns a page of items into plain column lists.  This is a module level function so it can run in a process pool.
+
+    :param spec: a dictionary of field_id to (external_id, field type)
+    :param items: The items as returned by App.filter_items
+    :return: a dictionary of external_id to the values of that column, plus "item_id"
+    """
+    columns = {external_id: [] for external_id, _ in spec.values()}
+    columns["item_id"] = []
+
+    for item in items:
+        columns["item_id"].append(item["item_id"])
+        values = {field["field_id"]: field["values"] for field in item["fields"] if field["values"]}
+
+        for field_id, (external_id, field_type) in spec.items():
+            value = values.get(field_id, [None])[0]
+            columns[external_id].append(_convert_value(field_type, value))
+
+    return columns
+
+
+def _convert_value(field_type: str, value: dict):
+    if value is None:
+        if field_type in FLOAT_TYPES:
+            return float("nan")
+        elif field_type in INT_TYPES:
+            return -1
+        return None
+
+    if field_type == "date":
+        start = value.get("start_utc") or value["start"]
+        return datetime.fromisoformat(start).replace(tzinfo=timezone.utc).timestamp()
+    elif field_type in FLOAT_TYPES:
+        return float(value["value"])
+    elif field_type == "category":
+        return value["value"]["id"]
+    elif field_type == "app":
+        return value["value"]["item_id"]
+    elif field_type == "contact":
+        return value["value"]["profile_id"]
+
+    return value.get("value")
+
+
+class Table:
+    def __init__(self, fields: list[dict]):
+        """
+        :param fields: The field definitions of the app, as found in App.data["fields"]
+        """
+        self.spec = {field["field_id"]: (field["external_id"], column_type(field)) for field in fields}
+        self.categories = {
+            field["external_id"]: {option["id"]: option["text"] for option in field["config"]["settings"]["options"]}
+            for field in fields if field["type"] == "category"
+        }
+
+        self._columns = {"item_id": array("q")}
+        for external_id, field_type in self.spec.values():
+            if field_type in FLOAT_TYPES:
+                self._columns[external_id] = array("d")
+            elif field_type in INT_TYPES:
+                self._columns[external_id] = array("q")
+            else:
+                self._columns[external_id] = []
+
+        self._numpy_columns: dict = None
+
+    def __len__(self):
+        return len(self._columns["item_id"])
+
+    def extend(self, columns: dict[str, list]):
+        """
+        Adds converted rows to the table
+
+        :param columns: Column lists as returned by convert_items
+        """
+        for external_id, values in columns.items():
+            self._columns[external_id].extend(values)
+
+        self._numpy_columns = None
+
+    def append_items(self, items: list[dict]):
+        """
+        Converts a page of items and adds them to the table
+
+        :param items: The items as returned by App.filter_items
+        """
+        self.extend(convert_items(self.spec, items))
+
+    @property
+    def columns(self) -> dict:
+        """
+        The columns of the table, as NumPy arrays if NumPy is installed.  The arrays are built once and reused until
+        more rows are added.
+
+        :return: a dictionary of external_id to column
+        """
+        if numpy is None:
+            return self._columns
+        if self._numpy_columns is not None:
+            return self._numpy_columns
+
+        columns = {}
+        for external_id, column in self._columns.items():
+            if isinstance(column, array):
+                columns[external_id] = numpy.array(column, dtype=numpy.float64 if column.typecode == "d"
+                                                   else numpy.int64)
+            else:
+                columns[external_id] = numpy.array(column, dtype=object)
+
+        self._numpy_columns = columns
+
+        return columns
+
+    @classmethod
+    async def from_app(cls, app: App, filters: dict = None, page_size: int = 500, processes: int = None) -> "Table":
+        """
+        Builds a table from the items of an app, one page at a time
+
+        :param app: The App to read the items from
+        :param filters: The filters to apply.  See App.filter_items
+        :param page_size: The number of items to read per request, at most 500
+        :param processes: If given, pages are converted in a pool of this many processes, while later pages are
+                          still being fetched.  Useful for very large exports
+        :return: a Table of the matching items
+        """
+        table = cls(app.data["fields"])
+        loop = asyncio.get_running_loop()
+        executor = ProcessPoolExecutor(processes) if processes else None
+
+        try:
+            offset = 0
+            # Pages being converted, oldest first so rows stay in order
+            converting = deque()
+            while True:
+                response = await app.filter_items(filters=filters, limit=page_size, offset=offset)
+                items = response["items"]
+
+                if executor is None:
+                    table.append_items(items)
+                else:
+                    converting.append(loop.run_in_executor(executor, convert_items, table.spec, items))
+                    # Keep every worker busy without holding the whole export in memory
+                    while len(converting) > 2 * processes:
+                        table.extend(await converting.popleft())
+
+                offset += len(items)
+                if len(items) < page_size:
+                    break
+
+            while converting:
+                table.extend(await converting.popleft())
+        finally:
+            if executor is not None:
+                executor.shutdown()
+
+        return table
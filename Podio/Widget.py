@@ -7,6 +7,7 @@ For Classes that use Widgets:
 
 Refer to Widget Configuration Here: https://developers.podio.com/doc/widgets
 """
+import asyncio
 import logging
 
 from collections import UserDict
@@ -131,5 +132,135 @@ class Widget(UserDict):
 
         self.data.update(response.data)
 
+    async def edit(self, title: str = None, config: dict = None, cols: int = None, rows: int = None,
+                   x: int = None, y: int = None):
+        """
+        Updates the widget's title, config and layout. Only the properties that are given are sent.
+
+        :param title: The new title of the widget
+        :param config: The new configuration of the widget
+        :param cols: The number of columns the widget spans
+        :param rows: The number of rows the widget spans
+        :param x: The horizontal position of the widget
+        :param y: The vertical position of the widget
+        """
+        payload = {
+            "title": title if title is not None else self["title"],
+            "config": config if config is not None else self.get("config", {}),
+        }
+        if rows is not None:
+            payload.update({"rows": rows})
+        if cols is not None:
+            payload.update({"cols": cols})
+        if x is not None:
+            payload.update({"x": x})
+        if y is not None:
+            payload.update({"y": y})
+
+        await self.interface.call(f"/widget/{self['widget_id']}", method="PUT", json=payload)
+
+        self.data.update(payload)
+
     async def delete(self):
-        await self.interface.call(f"/widget/{self['widget_id']}", method="DELETE")
\ No newline at end of file
+        await self.interface.call(f"/widget/{self['widget_id']}", method="DELETE")
+
+    @classmethod
+    def validate_layout(cls, layout: list[dict]):
+        """
+        Validates a desired widget layout against WIDGET_TYPES
+
+        :param layout: A list of widget definitions, each with "type", "title", "config" and optionally
+                       "x", "y", "rows" and "cols"
+        """
+        errors = []
+        for index, widget in enumerate(layout):
+            widget_type = widget.get("type")
+            if widget_type not in cls.WIDGET_TYPES:
+                errors.append(f"Widget {index}: Not a valid widget type.  Valid widget types are "
+                              f"\"{cls.QUOTED_LIST.join(cls.WIDGET_TYPES)}\"")
+            elif not all([widget_prop in widget.get("config", {}) for widget_prop in cls.WIDGET_TYPES[widget_type]]):
+                errors.append(f"Widget {index}: Widget Config must contain the following properties: "
+                              f"\"{cls.QUOTED_LIST.join(cls.WIDGET_TYPES[widget_type])}\"")
+            if "title" not in widget:
+                errors.append(f"Widget {index}: Widget must have a title")
+
+        if errors:
+            raise Exception("\n".join(errors))
+
+    @classmethod
+    def plan_layout(cls, current: list["Widget"], layout: list[dict]) -> dict:
+        """
+        Computes the minimal set of changes needed to turn the current widgets into the desired layout.
+
+        Widgets are matched on their type and title.  A matched widget is only updated when its position, or one of
+        the config properties given in the layout, differs from the desired layout.  Config properties the layout
+        leaves out, such as defaults Podio adds, are kept as they are.
+
+        :param current: The widgets currently on the reference
+        :param layout: The desired widget layout.  See validate_layout
+        :return: a dictionary with "create", "update" and "delete" lists
+        """
+        cls.validate_layout(layout)
+
+        unmatched = list(current)
+        plan = {"create": [], "update": [], "delete": []}
+
+        for desired in layout:
+            config = {prop: value for prop, value in desired["config"].items() if value is not None}
+            desired = {**desired, "config": config}
+
+            match = next((widget for widget in unmatched
+                          if widget["type"] == desired["type"] and widget["title"] == desired["title"]), None)
+            if match is None:
+                plan["create"].append(desired)
+                continue
+
+            unmatched.remove(match)
+            changes = {}
+            current_config = match.get("config", {})
+            if any(current_config.get(prop) != value for prop, value in config.items()):
+                changes.update({"config": {**current_config, **config}})
+            for prop in ("x", "y", "rows", "cols"):
+                if desired.get(prop) is not None and match.get(prop) != desired[prop]:
+                    changes.update({prop: desired[prop]})
+
+            if changes:
+                plan["update"].append((match, changes))
+
+        plan["delete"].extend(unmatched)
+
+        return plan
+
+    @classmethod
+    async def reconcile(cls, interface: Interface, ref_type: str, ref_id: int, layout: list[dict],
+                        dry_run: bool = False) -> dict:
+        """
+        Brings the widgets of a reference in line with the desired layout, making only the needed calls
+
+        :param interface: The interface to interact with the Podio API
+        :param ref_type: the reference type of the object being reconciled
+        :param ref_id: the id of the object being reconciled
+        :param layout: The desired widget layout.  See validate_layout
+        :param dry_run: If True, only return the plan and make no changes
+        :return: the plan that was (or would be) applied.  See plan_layout
+        """
+        current = await cls.list_widgets(interface, ref_type, ref_id)
+        plan = cls.plan_layout(current, layout)
+
+        if dry_run:
+            return plan
+
+        calls = []
+        for desired in plan["create"]:
+            calls.append(cls.add_widget(interface, ref_type, ref_id,
+                                        widget_type=desired["type"], title=desired["title"],
+                                        config=desired["config"], cols=desired.get("cols"),
+                                        rows=desired.get("rows"), x=desired.get("x"), y=desired.get("y")))
+        for widget, changes in plan["update"]:
+            calls.append(widget.edit(**changes))
+        for widget in plan["delete"]:
+            calls.append(widget.delete())
+
+        await asyncio.gather(*calls)
+
+        return plan
\ No newline at end of file
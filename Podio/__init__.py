@@ -1,10 +1,71 @@
-from .Client import Client
-from .Interface import Interface
-from .Space import Space
-from .Organization import Organization
-from .App import App
-from .Files import File
-from .Flow import Flow
-from .Member import Member
-from .Tools import Tools
-from .Widget import Widget
\ No newline at end of file
+"""
+The submodules are imported the first time one of their names is used, so "import Podio" stays cheap.
+"""
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import TYPE_CHECKING
+
+_modules = {
+    "Client": ".Client",
+    "Blocking": ".Blocking",
+    "BlockingClient": ".Blocking",
+    "Interface": ".Interface",
+    "Space": ".Space",
+    "Organization": ".Organization",
+    "App": ".App",
+    "File": ".Files",
+    "Flow": ".Flow",
+    "Hook": ".Hook",
+    "Member": ".Member",
+    "Migration": ".Migration",
+    "Receiver": ".Receiver",
+    "Table": ".Table",
+    "Tools": ".Tools",
+    "Widget": ".Widget",
+}
+
+__all__ = list(_modules)
+
+if TYPE_CHECKING:
+    from .Client import Client
+    from .Blocking import Blocking, BlockingClient
+    from .Interface import Interface
+    from .Space import Space
+    from .Organization import Organization
+    from .App import App
+    from .Files import File
+    from .Flow import Flow
+    from .Hook import Hook
+    from .Member import Member
+    from .Migration import Migration
+    from .Receiver import Receiver
+    from .Table import Table
+    from .Tools import Tools
+    from .Widget import Widget
+
+
+class _Package(ModuleType):
+    def __setattr__(self, name, value):
+        # Importing a submodule binds it on the package under the class's name, so bind the class instead
+        if name in _modules and isinstance(value, ModuleType) and hasattr(value, name):
+            value = getattr(value, name)
+
+        super().__setattr__(name, value)
+
+
+sys.modules[__name__].__class__ = _Package
+
+
+def __getattr__(name):
+    if name not in _modules:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+    value = getattr(import_module(_modules[name], __name__), name)
+    globals()[name] = value
+
+    return value
+
+
+def __dir__():
+    return sorted(list(globals()) + __all__)
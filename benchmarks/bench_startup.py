@@ -0,0 +1,50 @@
+"""
+Measures the cold start cost of the package.
+
+Each measurement runs in a fresh interpreter so nothing is already imported.
+
+    python benchmarks/bench_startup.py [runs]
+"""
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+CASES = {
+    "interpreter": "pass",
+    "import Podio": "import Podio",
+    "import Client": "from Podio import Client",
+    "new Client": "from Podio import Client; Client('id', 'secret', 'token')",
+}
+
+TIMER = """
+import time
+start = time.perf_counter()
+{code}
+print(time.perf_counter() - start)
+"""
+
+
+def measure(code: str, runs: int) -> list[float]:
+    times = []
+    for _ in range(runs):
+        output = subprocess.run([sys.executable, "-c", TIMER.format(code=code)], cwd=ROOT, check=True,
+                                capture_output=True, text=True).stdout
+        times.append(float(output))
+
+    return times
+
+
+def main():
+    runs = int(sys.argv[1]) if len(sys.argv) > 1 else 10
+
+    for name, code in CASES.items():
+        times = measure(code, runs)
+        print(f"{name:<24} median {statistics.median(times) * 1000:8.2f} ms   "
+              f"min {min(times) * 1000:8.2f} ms   ({runs} runs)")
+
+
+if __name__ == "__main__":
+    main()
@@ -13,5 +13,8 @@ setup(
     description='A Python interface to Podio',
     requires=[
         "aiohttp"
-    ]
+    ],
+    extras_require={
+        "numpy": ["numpy"]
+    }
 )
@@ -0,0 +1,26 @@
+import pytest
+
+
+class FakeResponse:
+    def __init__(self, data):
+        self.data = data
+
+    async def json(self):
+        return self.data
+
+
+class FakeInterface:
+    """ Stands in for Interface, answering calls from a dictionary of (method, endpoint) to response data """
+
+    def __init__(self, responses: dict = None):
+        self.responses = responses or {}
+        self.calls = []
+
+    async def call(self, endpoint: str, method: str = "GET", **kwargs):
+        self.calls.append((method, endpoint, kwargs))
+        return FakeResponse(self.responses.get((method, endpoint)))
+
+
+@pytest.fixture
+def interface():
+    return FakeInterface()
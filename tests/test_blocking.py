@@ -0,0 +1,55 @@
+import pytest
+from aiohttp import web
+
+from Podio.Blocking import Blocking, BlockingClient
+from Podio.Interface import Interface
+from Podio.Widget import Widget
+
+
+async def start_server(port_holder: list) -> web.AppRunner:
+    async def token(request):
+        return web.json_response({"access_token": "token"})
+
+    async def app(request):
+        app_id = int(request.match_info["app_id"])
+        if app_id == 404:
+            return web.json_response({"error_description": "Not found"}, status=404)
+        return web.json_response({"app_id": app_id})
+
+    server = web.Application()
+    server.router.add_post("/oauth/token", token)
+    server.router.add_get("/app/{app_id}", app)
+
+    runner = web.AppRunner(server)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+    port_holder.append(site._server.sockets[0].getsockname()[1])
+
+    return runner
+
+
+def test_shared_client_survives_request_errors():
+    with BlockingClient("id", "secret", refresh_token="refresh") as podio:
+        port = []
+        runner = podio.submit(start_server(port))
+        podio.interface.base_url = f"http://127.0.0.1:{port[0]}"
+
+        try:
+            with pytest.raises(Exception, match="Not found"):
+                podio.get_app_by_id(404)
+
+            assert podio.get_app_by_id(1).app_id == 1
+        finally:
+            podio.submit(runner.cleanup())
+
+
+def test_results_inside_dicts_and_tuples_are_wrapped():
+    widget = Widget(Interface("secret", "id", "refresh"), "space", 1, {"widget_id": 3})
+    blocking = Blocking(None, None)
+
+    result = blocking._wrap({"update": [(widget, {"config": {}})], 1: [widget]})
+
+    assert isinstance(result["update"][0], tuple)
+    assert isinstance(result["update"][0][0], Blocking) and result["update"][0][1] == {"config": {}}
+    assert isinstance(result[1][0], Blocking)
@@ -0,0 +1,22 @@
+import asyncio
+
+from Podio.Client import Client
+
+
+def test_get_app_by_id_only_caches_while_listening(interface):
+    interface.responses[("GET", "/app/1")] = {"app_id": 1}
+    client = Client("id", "secret", "refresh")
+    client.interface = interface
+
+    async def run():
+        await client.get_app_by_id(1)
+        await client.get_app_by_id(1)
+        fetched = len(interface.calls)
+
+        client.receiver = object()
+        await client.get_app_by_id(1)
+        await client.get_app_by_id(1)
+
+        return fetched, len(interface.calls) - fetched
+
+    assert asyncio.run(run()) == (2, 1)
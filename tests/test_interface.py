@@ -0,0 +1,72 @@
+import asyncio
+
+from aiohttp import web
+
+from Podio.Interface import Interface
+
+
+async def start_server(tokens: list, expires_in: int = 28800, reject_first: bool = False) -> tuple:
+    """ Serves /oauth/token and /app/1, where /app/1 only accepts the latest token """
+    rejected = []
+
+    async def token(request):
+        tokens.append(f"token{len(tokens)}")
+        return web.json_response({"access_token": tokens[-1], "expires_in": expires_in,
+                                  "refresh_token": "refresh"})
+
+    async def app(request):
+        if reject_first and not rejected:
+            rejected.append(True)
+            return web.json_response({"error_description": "expired_token"}, status=401)
+        if request.headers["Authorization"] != f"OAuth2 {tokens[-1]}":
+            return web.json_response({"error_description": "invalid_token"}, status=401)
+        return web.json_response({"app_id": 1})
+
+    server = web.Application()
+    server.router.add_post("/oauth/token", token)
+    server.router.add_get("/app/1", app)
+
+    runner = web.AppRunner(server)
+    await runner.setup()
+    site = web.TCPSite(runner, "127.0.0.1", 0)
+    await site.start()
+
+    return runner, f"http://127.0.0.1:{site._server.sockets[0].getsockname()[1]}"
+
+
+def call_twice(**server_kwargs) -> tuple:
+    async def run():
+        tokens = []
+        runner, url = await start_server(tokens, **server_kwargs)
+        interface = Interface("secret", "id", refresh_token="refresh")
+        interface.base_url = url
+        try:
+            results = [await (await interface.call("/app/1")).json() for _ in range(2)]
+        finally:
+            await interface.close()
+            await runner.cleanup()
+
+        return results, tokens
+
+    return asyncio.run(run())
+
+
+def test_token_is_reused_while_valid():
+    results, tokens = call_twice()
+
+    assert results == [{"app_id": 1}] * 2
+    assert tokens == ["token0"]
+
+
+def test_reauthenticates_and_retries_on_401():
+    results, tokens = call_twice(reject_first=True)
+
+    assert results == [{"app_id": 1}] * 2
+    assert tokens == ["token0", "token1"]
+
+
+def test_expired_token_is_renewed_before_the_call():
+    results, tokens = call_twice(expires_in=0)
+
+    assert results == [{"app_id": 1}] * 2
+    assert tokens == ["token0", "token1"]
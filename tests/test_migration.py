@@ -0,0 +1,68 @@
+import asyncio
+
+import pytest
+from conftest import FakeResponse
+
+from Podio.App import App
+from Podio.Migration import Migration
+
+FIELDS = [
+    {"field_id": 1, "external_id": "name", "label": "Name", "type": "text"},
+    {"field_id": 2, "external_id": "total", "label": "Total", "type": "calculation"},
+    {"field_id": 3, "external_id": "email", "label": "Email", "type": "email"},
+]
+
+
+def make_apps(interface) -> tuple:
+    source = App(interface, {"app_id": 1, "fields": FIELDS})
+    target = App(interface, {"app_id": 2, "fields": [{**field, "field_id": field["field_id"] + 10}
+                                                     for field in FIELDS]})
+
+    return source, target
+
+
+def test_calculation_fields_are_not_migrated(interface, tmp_path):
+    migration = Migration(*make_apps(interface), str(tmp_path / "checkpoint.json"))
+
+    assert {field_id: field["external_id"] for field_id, field in migration.field_map.items()} == \
+        {1: "name", 3: "email"}
+
+
+def test_email_keeps_its_type(interface, tmp_path):
+    migration = Migration(*make_apps(interface), str(tmp_path / "checkpoint.json"))
+    values = [{"type": "work", "value": "a@b.c"}]
+
+    assert asyncio.run(migration._convert_values(migration.field_map[3], values)) == values
+
+
+def test_resumes_from_checkpoint_without_duplicates_or_gaps(interface, tmp_path):
+    source_items = [{"item_id": item_id, "fields": [{"field_id": 1, "values": [{"value": f"item {item_id}"}]}]}
+                    for item_id in range(1, 6)]
+    written = []
+    # Item 3 is written before item 4 fails, so the second run has to skip it
+    fail_on = {"item 4"}
+
+    async def call(endpoint, method="GET", **kwargs):
+        if endpoint == "/item/app/1/filter/":
+            offset, limit = kwargs["json"]["offset"], kwargs["json"]["limit"]
+            data = {"items": source_items[offset:offset + limit]}
+        else:
+            name = kwargs["json"]["fields"]["name"][0]
+            if name in fail_on:
+                raise Exception("Rate limited")
+            written.append(name)
+            data = {"item_id": 100 + len(written)}
+        return FakeResponse(data)
+
+    interface.call = call
+    checkpoint = str(tmp_path / "checkpoint.json")
+
+    # The first run stops part way through the second page
+    with pytest.raises(Exception, match="Rate limited"):
+        asyncio.run(Migration(*make_apps(interface), checkpoint, page_size=2, concurrency=1).run())
+
+    fail_on.clear()
+    total = asyncio.run(Migration(*make_apps(interface), checkpoint, page_size=2, concurrency=1).run())
+
+    assert total == 5
+    assert sorted(written) == [f"item {item_id}" for item_id in range(1, 6)]
@@ -0,0 +1,23 @@
+import subprocess
+import sys
+
+import pytest
+
+
+def run(code: str):
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_import_does_not_load_submodules():
+    run("import sys, Podio; assert not [name for name in sys.modules if name.startswith('Podio.')]")
+
+
+@pytest.mark.parametrize("first, then", [
+    ("Client", "App, Space, Organization, Interface, Widget"),
+    ("App", "Flow, Widget, Interface"),
+    ("Migration", "App, File, Interface"),
+])
+def test_names_are_classes_after_submodule_imports(first, then):
+    run(f"from Podio import {first}\n"
+        f"from Podio import {then}\n"
+        f"assert all(isinstance(obj, type) for obj in ({first}, {then}))")
@@ -0,0 +1,73 @@
+import asyncio
+
+from aiohttp.test_utils import TestClient, TestServer
+
+from Podio.Client import Client
+from Podio.Receiver import Receiver
+
+
+def post_events(receiver: Receiver, *events: dict):
+    async def run():
+        async with TestClient(TestServer(receiver.app)) as client:
+            for event in events:
+                response = await client.post(receiver.path, data=event)
+                assert response.status == 200
+            # Let the handlers started by the events run
+            await asyncio.sleep(0.01)
+        await receiver.stop()
+
+    asyncio.run(run())
+
+
+def test_verify_handshake_validates_the_code(interface):
+    post_events(Receiver(interface), {"type": "hook.verify", "hook_id": "12", "code": "abc"})
+
+    assert interface.calls == [("POST", "/hook/12/verify/validate", {"json": {"code": "abc"}})]
+
+
+def test_event_ids_are_converted_to_ints(interface):
+    receiver = Receiver(interface)
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    receiver.on("item.update", handler)
+    post_events(receiver, {"type": "item.update", "hook_id": "1", "item_id": "6", "item_revision_id": "2"})
+
+    assert received == [{"type": "item.update", "hook_id": 1, "item_id": 6, "item_revision_id": 2}]
+
+
+def test_stop_cancels_running_handlers(interface):
+    receiver = Receiver(interface)
+    finished = []
+
+    async def handler(event):
+        await asyncio.sleep(10)
+        finished.append(event)
+
+    receiver.on("item.create", handler)
+    post_events(receiver, {"type": "item.create", "item_id": "6"})
+
+    assert finished == [] and not receiver._tasks
+
+
+def test_client_skips_item_fetch_without_handlers(interface):
+    interface.responses[("GET", "/item/6")] = {"item_id": 6}
+    client = Client("id", "secret", "refresh")
+    client.interface = interface
+    received = []
+
+    async def handler(event):
+        received.append(event)
+
+    client.on("item.update", handler)
+
+    async def run():
+        await client._item_event({"type": "item.create", "item_id": 6})
+        await client._item_event({"type": "item.update", "item_id": 6})
+
+    asyncio.run(run())
+
+    assert interface.calls == [("GET", "/item/6", {})]
+    assert received == [{"type": "item.update", "item_id": 6, "item": {"item_id": 6}}]
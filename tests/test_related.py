@@ -0,0 +1,100 @@
+import asyncio
+
+import pytest
+
+from Podio.Organization import Organization
+from Podio.Space import Space
+
+SPACES = [{"space_id": 1}, {"space_id": 2}]
+
+
+@pytest.fixture
+def org(interface):
+    interface.responses[("GET", "/space/org/5/")] = SPACES
+    for space in SPACES:
+        interface.responses[("GET", f"/app/space/{space['space_id']}")] = [{"app_id": 10}]
+        interface.responses[("GET", f"/widget/space/{space['space_id']}")] = [{"widget_id": 20}]
+    interface.responses[("GET", "/app/10")] = {"app_id": 10}
+
+    return Organization("acme", interface, {"org_id": 5})
+
+
+def test_relations_are_memoized(org, interface):
+    async def run():
+        return await org.get_spaces(), await org.get_spaces()
+
+    first, second = asyncio.run(run())
+
+    assert first is second
+    assert len(interface.calls) == 1
+
+
+def test_invalidate_forces_a_refetch(org, interface):
+    async def run():
+        first = await org.get_spaces()
+        org.invalidate("spaces")
+        return first, await org.get_spaces()
+
+    first, second = asyncio.run(run())
+
+    assert first is not second
+    assert len(interface.calls) == 2
+
+
+def test_prefetch_loads_the_subgraph(org, interface):
+    async def run():
+        await org.prefetch("spaces.apps", "spaces.widgets")
+        calls = len(interface.calls)
+
+        for space in await org.get_spaces():
+            await space.get_apps()
+            await space.get_widgets()
+
+        return calls
+
+    calls = asyncio.run(run())
+
+    # The org's spaces, then each space's apps (listing and app) and widgets, with nothing fetched afterwards
+    assert calls == 1 + len(SPACES) * 3
+    assert len(interface.calls) == calls
+
+
+def test_unknown_relation_raises(org):
+    with pytest.raises(Exception, match="Not a valid relation"):
+        asyncio.run(org.prefetch("spaces.nope"))
+
+
+def test_reconcile_widgets_invalidates_after_a_failure(interface):
+    interface.responses[("GET", "/widget/space/1")] = [{"widget_id": 3, "type": "text", "title": "Old",
+                                                         "config": {"text": "Bye"}}]
+    space = Space(interface, {"space_id": 1})
+    call = interface.call
+
+    async def failing_call(endpoint, method="GET", **kwargs):
+        if method == "DELETE":
+            raise Exception("Forbidden")
+        return await call(endpoint, method, **kwargs)
+
+    interface.call = failing_call
+
+    async def run():
+        await space.get_widgets()
+        with pytest.raises(Exception, match="Forbidden"):
+            await space.reconcile_widgets([])
+
+    asyncio.run(run())
+
+    assert "widgets" not in space._related
+
+
+def test_bulk_add_members_invalidates_members(interface):
+    interface.responses[("GET", "/space/1/member/")] = []
+    space = Space(interface, {"space_id": 1})
+
+    async def run():
+        await space.get_members()
+        await Space.bulk_add_members(interface, [space], "regular", "Welcome", users=[5])
+
+    asyncio.run(run())
+
+    assert "members" not in space._related
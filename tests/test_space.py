@@ -0,0 +1,52 @@
+import asyncio
+
+from Podio.Space import Space
+
+
+def test_bulk_add_members_reports_by_kind(interface):
+    interface.responses[("GET", "/space/1/member/")] = [{"user": {"user_id": 5, "mail": "a@example.com"},
+                                                         "profile": {"profile_id": 9}}]
+    call = interface.call
+
+    async def failing_call(endpoint, method="GET", **kwargs):
+        if method == "POST" and 6 in kwargs["json"].get("users", []):
+            await call(endpoint, method, **kwargs)
+            raise Exception("Invalid user")
+        return await call(endpoint, method, **kwargs)
+
+    interface.call = failing_call
+
+    report = asyncio.run(Space.bulk_add_members(interface, [1], "regular", "Welcome", users=[5, 6, 7],
+                                                profiles=[5, 9], mails=["A@example.com"], chunk_size=1))
+
+    assert report == {1: {
+        "users": {5: "existing", 6: "Invalid user", 7: "added"},
+        "profiles": {5: "added", 9: "existing"},
+        "mails": {"A@example.com": "existing"},
+    }}
+
+
+def test_add_widget_invalidates_after_the_widget_is_added(interface):
+    interface.responses[("GET", "/widget/space/1")] = []
+    interface.responses[("POST", "/widget/space/1/")] = {"widget_id": 3}
+    interface.responses[("GET", "/widget/3")] = {"widget_id": 3, "ref": {"type": "space", "id": 1}}
+    space = Space(interface, {"space_id": 1})
+    call = interface.call
+
+    async def slow_call(endpoint, method="GET", **kwargs):
+        if method == "POST":
+            await asyncio.sleep(0.01)
+        return await call(endpoint, method, **kwargs)
+
+    interface.call = slow_call
+
+    async def run():
+        # A listing made while the POST is in flight must not stay cached
+        adding = asyncio.ensure_future(space.add_widget("text", "Hello", {"text": "Hi"}))
+        await asyncio.sleep(0)
+        await space.get_widgets()
+        await adding
+
+        return "widgets" in space._related
+
+    assert asyncio.run(run()) is False
@@ -0,0 +1,59 @@
+import asyncio
+import math
+
+import pytest
+
+from Podio.Table import Table
+
+
+def calculation(field_id: int, external_id: str, return_type: str) -> dict:
+    return {"field_id": field_id, "external_id": external_id, "type": "calculation",
+            "config": {"settings": {"return_type": return_type}}}
+
+
+def test_calculation_columns_follow_return_type():
+    table = Table([calculation(1, "total", "number"), calculation(2, "label", "text"),
+                   calculation(3, "due", "date")])
+    table.append_items([
+        {"item_id": 7, "fields": [{"field_id": 1, "values": [{"value": "2.5"}]},
+                                  {"field_id": 2, "values": [{"value": "hello"}]},
+                                  {"field_id": 3, "values": [{"start": "1970-01-02 00:00:00"}]}]},
+        {"item_id": 8, "fields": []},
+    ])
+
+    columns = table.columns
+    assert list(columns["total"][:1]) == [2.5] and math.isnan(columns["total"][1])
+    assert list(columns["label"]) == ["hello", None]
+    assert columns["due"][0] == 86400.0
+
+
+class FakeApp:
+    def __init__(self, fields: list[dict], items: list[dict]):
+        self.data = {"fields": fields}
+        self.items = items
+
+    async def filter_items(self, filters=None, limit=30, offset=0):
+        return {"items": self.items[offset:offset + limit]}
+
+
+def test_from_app_keeps_page_order_with_a_process_pool():
+    fields = [{"field_id": 1, "external_id": "amount", "type": "number"}]
+    items = [{"item_id": item_id, "fields": [{"field_id": 1, "values": [{"value": item_id}]}]}
+             for item_id in range(25)]
+
+    table = asyncio.run(Table.from_app(FakeApp(fields, items), page_size=4, processes=2))
+
+    assert list(table.columns["item_id"]) == list(range(25))
+    assert list(table.columns["amount"]) == [float(item_id) for item_id in range(25)]
+
+
+def test_numpy_columns_are_cached_until_rows_are_added():
+    pytest.importorskip("numpy")
+    table = Table([{"field_id": 1, "external_id": "amount", "type": "number"}])
+    table.append_items([{"item_id": 1, "fields": [{"field_id": 1, "values": [{"value": 1}]}]}])
+
+    assert table.columns is table.columns
+
+    columns = table.columns
+    table.append_items([{"item_id": 2, "fields": []}])
+    assert table.columns is not columns and len(table.columns["item_id"]) == 2
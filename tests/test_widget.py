@@ -0,0 +1,47 @@
+import asyncio
+from Podio.Widget import Widget
+
+WIDGETS = [
+    {"widget_id": 1, "type": "text", "title": "Welcome", "config": {"text": "Hello"}, "x": 0, "y": 0},
+    {"widget_id": 2, "type": "text", "title": "Old", "config": {"text": "Bye"}, "x": 1, "y": 0},
+    {"widget_id": 3, "type": "tasks", "title": "Tasks", "config": {"kind": "all", "limit": 5}, "x": 2, "y": 0},
+]
+
+
+def test_list_widgets_keeps_data(interface):
+    interface.responses[("GET", "/widget/space/10")] = WIDGETS
+
+    widgets = asyncio.run(Widget.list_widgets(interface, "space", 10))
+
+    assert [widget["widget_id"] for widget in widgets] == [1, 2, 3]
+    assert widgets[0]["title"] == "Welcome"
+
+
+def test_plan_layout_against_listed_widgets(interface):
+    interface.responses[("GET", "/widget/space/10")] = WIDGETS
+    layout = [
+        {"type": "text", "title": "Welcome", "config": {"text": "Hello"}, "x": 0, "y": 0},
+        {"type": "tasks", "title": "Tasks", "config": {"kind": "all", "limit": 10}},
+        {"type": "events", "title": "Events", "config": {"limit": 3}},
+    ]
+
+    plan = asyncio.run(Widget.reconcile(interface, "space", 10, layout, dry_run=True))
+
+    assert [desired["title"] for desired in plan["create"]] == ["Events"]
+    assert [(widget["widget_id"], changes) for widget, changes in plan["update"]] == \
+        [(3, {"config": {"kind": "all", "limit": 10}})]
+    assert [widget["widget_id"] for widget in plan["delete"]] == [2]
+    assert interface.calls == [("GET", "/widget/space/10", {})]
+
+
+def test_plan_layout_ignores_config_podio_adds():
+    current = [Widget(None, "space", 10, {"widget_id": 1, "type": "tasks", "title": "Tasks",
+                                          "config": {"kind": "all", "limit": 5, "show_completed": False}})]
+
+    unchanged = Widget.plan_layout(current, [{"type": "tasks", "title": "Tasks",
+                                              "config": {"kind": "all", "limit": 5}}])
+    changed = Widget.plan_layout(current, [{"type": "tasks", "title": "Tasks",
+                                            "config": {"kind": "all", "limit": 10}}])
+
+    assert unchanged == {"create": [], "update": [], "delete": []}
+    assert changed["update"] == [(current[0], {"config": {"kind": "all", "limit": 10, "show_completed": False}})]